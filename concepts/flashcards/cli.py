@@ -13,20 +13,35 @@ Features:
 - Beautiful terminal UI
 """
 
+import heapq
 import json
+import os
 import sys
-from datetime import datetime, timedelta
+from array import array
+from collections import Counter
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import compress
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
-from rich import box
-from rich.markdown import Markdown
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib json module
+    orjson = None
+
 
 console = Console()
 
+# Ordinal used for cards that have never been reviewed (always due)
+NEVER_REVIEWED = -1
+
+# SM-2 lookup tables: ease-factor change per answer quality (0-5), and the
+# fixed intervals for the first two successful repetitions
+_EF_DELTA = tuple(0.1 - (5 - q) * (0.08 + (5 - q) * 0.02) for q in range(6))
+_BASE_INTERVAL = (1, 6)
+
 
 class SpacedRepetition:
     """SM-2 Spaced Repetition Algorithm."""
@@ -58,41 +73,38 @@ class SpacedRepetition:
         """
         if quality < 3:
             # Reset on poor performance
-            new_repetitions = 0
-            new_interval = 1
-            new_ease_factor = ease_factor
-        else:
-            # Good performance
-            if repetitions == 0:
-                new_interval = 1
-            elif repetitions == 1:
-                new_interval = 6
-            else:
-                new_interval = int(interval * ease_factor)
-
-            new_repetitions = repetitions + 1
+            return 1, ease_factor, 0
 
-            # Adjust ease factor
-            new_ease_factor = ease_factor + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        # Good performance
+        new_interval = _BASE_INTERVAL[repetitions] if repetitions < 2 else int(interval * ease_factor)
 
-            # Ease factor should be at least 1.3
-            if new_ease_factor < 1.3:
-                new_ease_factor = 1.3
+        # Adjust ease factor; it should be at least 1.3
+        new_ease_factor = max(1.3, ease_factor + _EF_DELTA[min(quality, 5)])
 
-        return new_interval, new_ease_factor, new_repetitions
+        return new_interval, new_ease_factor, repetitions + 1
 
 
 class FlashcardManager:
     """Manage flashcard data and operations."""
 
-    def __init__(self, cards_file: str):
+    def __init__(self, cards_file: str, autosave_every: int = 20):
         """Initialize flashcard manager.
 
         Args:
             cards_file: Path to flashcards JSON file
+            autosave_every: Flush to disk after this many unsaved updates
+                (0 = only flush explicitly)
         """
         self.cards_file = Path(cards_file)
+        self.autosave_every = autosave_every
+        self._dirty = False
+        self._pending_updates = 0
         self.data = self._load_cards()
+        self._by_id = {card['id']: card for card in self.data['cards']}
+        self._position = {card['id']: i for i, card in enumerate(self.data['cards'])}
+        self._build_columns()
+        self._due_heaps = self._build_due_heaps()
+        self._due_cache: Dict[tuple, List[Dict]] = {}
 
     def _load_cards(self) -> Dict:
         """Load flashcards from JSON file."""
@@ -100,13 +112,91 @@ class FlashcardManager:
             console.print(f"[red]Error: Flashcard file not found: {self.cards_file}[/red]")
             sys.exit(1)
 
+        if orjson is not None:
+            with open(self.cards_file, 'rb') as f:
+                return orjson.loads(f.read())
+
         with open(self.cards_file, 'r') as f:
             return json.load(f)
 
+    @staticmethod
+    def _to_ordinal(timestamp: Optional[str]) -> int:
+        """Convert an ISO timestamp to a date ordinal (None -> NEVER_REVIEWED)."""
+        if timestamp is None:
+            return NEVER_REVIEWED
+        return date.fromisoformat(timestamp[:10]).toordinal()
+
+    def _build_columns(self):
+        """Mirror the scheduling fields into compact per-position columns.
+
+        The card dicts remain the source for JSON serialization; scans such
+        as get_stats read these columns instead. Next-review ordinals are
+        kept out of the JSON. The columns are stdlib arrays, so loading a
+        deck does not pull in NumPy.
+        """
+        cards = self.data['cards']
+
+        # Intern category names to small integer codes
+        self._category_names = sorted({card['category'] for card in cards})
+        self._category_index = {name: code for code, name in enumerate(self._category_names)}
+        self._category_codes = array('H', (self._category_index[card['category']] for card in cards))
+
+        self._next_review_ords = array('i', (self._to_ordinal(card['next_review']) for card in cards))
+        self._reviewed = bytearray(card['last_reviewed'] is not None for card in cards)
+        self._confidence = array('b', (card['confidence'] for card in cards))
+
+    def _sync_columns(self, position: int, card: Dict, next_review_ord: int):
+        """Copy a card's updated scheduling fields into its column slots."""
+        self._next_review_ords[position] = next_review_ord
+        self._reviewed[position] = card['last_reviewed'] is not None
+        self._confidence[position] = card['confidence']
+
+    def _build_due_heaps(self) -> Dict[Optional[int], List[tuple]]:
+        """Build min-heaps of (next_review_ordinal, position) entries.
+
+        One heap covers the whole deck (key None) plus one per category code.
+        """
+        heaps: Dict[Optional[int], List[tuple]] = {None: []}
+        for code in range(len(self._category_names)):
+            heaps[code] = []
+        for position, (review_ord, code) in enumerate(
+            zip(self._next_review_ords, self._category_codes)
+        ):
+            entry = (review_ord, position)
+            heaps[None].append(entry)
+            heaps[code].append(entry)
+
+        for heap in heaps.values():
+            heapq.heapify(heap)
+        return heaps
+
     def save_cards(self):
-        """Save flashcards to JSON file."""
-        with open(self.cards_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        """Save flashcards to JSON file.
+
+        The deck is serialized once and written to a sibling temp file,
+        which then replaces the original so a crash never leaves a
+        half-written deck behind.
+        """
+        # Keep the tracked file indented like web/app.py writes it, so saves
+        # from either side produce readable diffs
+        if orjson is not None:
+            payload = orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self.data, indent=2).encode('utf-8')
+
+        tmp_file = self.cards_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.cards_file)
+        self._dirty = False
+        self._pending_updates = 0
+
+    def flush(self):
+        """Write pending card updates to disk, if there are any."""
+        if self._dirty:
+            self.save_cards()
 
     def get_cards(self, category: Optional[str] = None) -> List[Dict]:
         """Get all cards, optionally filtered by category.
@@ -119,7 +209,10 @@ class FlashcardManager:
         """
         cards = self.data['cards']
         if category:
-            cards = [c for c in cards if c['category'] == category]
+            code = self._category_index.get(category)
+            if code is None:
+                return []
+            cards = [card for card, card_code in zip(cards, self._category_codes) if card_code == code]
         return cards
 
     def get_due_cards(self, category: Optional[str] = None) -> List[Dict]:
@@ -131,70 +224,145 @@ class FlashcardManager:
         Returns:
             List of due flashcard dictionaries
         """
-        today = datetime.now().date()
-        cards = self.get_cards(category)
-
-        due_cards = []
-        for card in cards:
-            if card['next_review'] is None:
-                # Never reviewed
-                due_cards.append(card)
-            else:
-                next_review = datetime.fromisoformat(card['next_review']).date()
-                if next_review <= today:
-                    due_cards.append(card)
-
-        return due_cards
-
-    def update_card(self, card_id: int, quality: int):
+        today = date.today()
+        key = (category, today.isoformat())
+        cached = self._due_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        # Drain entries due by today, skipping stale ones left by update_card,
+        # then push the live ones back so the heap stays intact
+        if category:
+            code = self._category_index.get(category)
+            if code is None:
+                # Unknown category; the None key would be the whole-deck heap
+                return []
+        else:
+            code = None
+        heap = self._due_heaps[code]
+        today_ord = today.toordinal()
+        ords = self._next_review_ords
+        due_positions = set()
+        live_entries = []
+        while heap and heap[0][0] <= today_ord:
+            entry = heapq.heappop(heap)
+            review_ord, position = entry
+            if ords[position] != review_ord or position in due_positions:
+                continue
+            due_positions.add(position)
+            live_entries.append(entry)
+        for entry in live_entries:
+            heapq.heappush(heap, entry)
+
+        cards = self.data['cards']
+        due_cards = [cards[position] for position in sorted(due_positions)]
+
+        self._due_cache[key] = due_cards
+        return list(due_cards)
+
+    def update_card(self, card_id: int, quality: int, now: Optional[datetime] = None):
         """Update card after review.
 
         Args:
             card_id: Card ID
             quality: Answer quality (0-5)
+            now: Review time (None = current time); pass one value to
+                reschedule many cards against the same clock reading
         """
-        for card in self.data['cards']:
-            if card['id'] == card_id:
-                # Calculate new schedule
-                new_interval, new_ease_factor, new_repetitions = SpacedRepetition.calculate_next_review(
-                    quality=quality,
-                    repetitions=card['repetitions'],
-                    ease_factor=card['ease_factor'],
-                    interval=card['interval']
-                )
-
-                # Update card
-                card['interval'] = new_interval
-                card['ease_factor'] = new_ease_factor
-                card['repetitions'] = new_repetitions
-                card['last_reviewed'] = datetime.now().isoformat()
-                card['next_review'] = (datetime.now() + timedelta(days=new_interval)).isoformat()
-                card['confidence'] = min(5, quality)
-
-                self.save_cards()
-                break
+        card = self._by_id.get(card_id)
+        if card is None:
+            return
+
+        # Calculate new schedule
+        new_interval, new_ease_factor, new_repetitions = SpacedRepetition.calculate_next_review(
+            quality=quality,
+            repetitions=card['repetitions'],
+            ease_factor=card['ease_factor'],
+            interval=card['interval']
+        )
+
+        # Update card
+        card['interval'] = new_interval
+        card['ease_factor'] = new_ease_factor
+        card['repetitions'] = new_repetitions
+        if now is None:
+            now = datetime.now().replace(microsecond=0)
+        # Schedule in day ordinals; the ISO date is only for the JSON file
+        next_review_ord = now.toordinal() + new_interval
+        card['last_reviewed'] = now.isoformat()
+        card['next_review'] = date.fromordinal(next_review_ord).isoformat()
+        card['confidence'] = min(5, quality)
+        position = self._position[card_id]
+        self._sync_columns(position, card, next_review_ord)
+        entry = (next_review_ord, position)
+        heapq.heappush(self._due_heaps[None], entry)
+        heapq.heappush(self._due_heaps[self._category_codes[position]], entry)
+        self._due_cache.clear()
+
+        # Defer persistence; the session flushes once at the end
+        self._dirty = True
+        self._pending_updates += 1
+        if self.autosave_every and self._pending_updates >= self.autosave_every:
+            self.save_cards()
+
+    def get_card(self, card_id: int) -> Optional[Dict]:
+        """Look up a card by its ID.
+
+        Args:
+            card_id: Card ID
+
+        Returns:
+            Flashcard dictionary, or None if no card has that ID
+        """
+        return self._by_id.get(card_id)
 
     def get_categories(self) -> List[str]:
         """Get list of all categories."""
-        return list(set(card['category'] for card in self.data['cards']))
+        return list(self._category_names)
+
+    def get_category_counts(self) -> Dict[str, Tuple[int, int]]:
+        """Count total and due cards for every category in one sweep.
+
+        Returns:
+            Mapping of category name to (total_cards, due_cards)
+        """
+        today_ord = date.today().toordinal()
+        codes = self._category_codes
+        totals = Counter(codes)
+        dues = Counter(compress(codes, (review_ord <= today_ord for review_ord in self._next_review_ords)))
+        return {
+            name: (totals[code], dues[code])
+            for code, name in enumerate(self._category_names)
+        }
 
     def get_stats(self) -> Dict:
         """Get statistics about flashcards."""
-        cards = self.data['cards']
-        total = len(cards)
-        reviewed = sum(1 for c in cards if c['last_reviewed'] is not None)
-        mastered = sum(1 for c in cards if c['confidence'] >= 4)
-        due = len(self.get_due_cards())
+        total = len(self.data['cards'])
+        today_ord = date.today().toordinal()
+
+        # NEVER_REVIEWED sorts below every real date, so it always counts as due
+        reviewed = self._reviewed.count(1)
+        mastered = sum(1 for confidence in self._confidence if confidence >= 4)
+        due = sum(1 for review_ord in self._next_review_ords if review_ord <= today_ord)
+        confidence_sum = sum(self._confidence)
 
         return {
             'total': total,
             'reviewed': reviewed,
             'mastered': mastered,
             'due': due,
-            'avg_confidence': sum(c['confidence'] for c in cards) / total if total > 0 else 0
+            'avg_confidence': confidence_sum / total if total > 0 else 0
         }
 
 
+@lru_cache(maxsize=1024)
+def _render_markdown(text: str):
+    """Build the Markdown renderable for an answer, memoized by its text."""
+    from rich.markdown import Markdown
+
+    return Markdown(text)
+
+
 class FlashcardCLI:
     """Interactive flashcard CLI."""
 
@@ -208,6 +376,8 @@ class FlashcardCLI:
 
     def show_main_menu(self):
         """Display main menu."""
+        from rich.panel import Panel
+
         console.clear()
         console.print(Panel.fit(
             "[bold cyan]Interview Prep Flashcards[/bold cyan]\n"
@@ -236,6 +406,9 @@ class FlashcardCLI:
         Args:
             category: Category to study (None = all)
         """
+        from rich.panel import Panel
+        from rich.prompt import Confirm, Prompt
+
         due_cards = self.manager.get_due_cards(category)
 
         if not due_cards:
@@ -249,64 +422,69 @@ class FlashcardCLI:
         correct_count = 0
         total_count = len(due_cards)
 
-        for i, card in enumerate(due_cards, 1):
-            console.clear()
-            console.print(f"[dim]Card {i}/{total_count}[/dim]\n")
-
-            # Show question
-            console.print(Panel(
-                f"[bold]{card['question']}[/bold]",
-                title=f"📁 {card['category']}",
-                border_style="cyan"
-            ))
-
-            console.print("\n[dim]Think about your answer...[/dim]")
-            Prompt.ask("\nPress Enter when ready to see the answer")
-
-            # Show answer
-            console.print("\n" + "=" * 60)
-            console.print(Panel(
-                Markdown(card['answer']),
-                title="Answer",
-                border_style="green"
-            ))
-
-            # Get self-assessment
-            console.print("\n[bold]How well did you know this?[/bold]")
-            console.print("  0: Complete blackout (forgot completely)")
-            console.print("  1: Incorrect, but remembered something")
-            console.print("  2: Incorrect, but close")
-            console.print("  3: [yellow]Correct, but difficult[/yellow]")
-            console.print("  4: [green]Correct, after hesitation[/green]")
-            console.print("  5: [bold green]Perfect recall![/bold green]")
-
-            quality = -1
-            while quality < 0 or quality > 5:
-                try:
-                    quality = int(Prompt.ask("\nYour rating (0-5)", default="3"))
-                    if quality < 0 or quality > 5:
-                        console.print("[red]Please enter a number between 0 and 5[/red]")
-                except ValueError:
-                    console.print("[red]Please enter a valid number[/red]")
-
-            # Update card
-            self.manager.update_card(card['id'], quality)
-
-            if quality >= 3:
-                correct_count += 1
-                console.print("[green]Good job![/green]")
-            else:
-                console.print("[yellow]📝 We'll review this again soon.[/yellow]")
-
-            # Show next review date
-            for c in self.manager.data['cards']:
-                if c['id'] == card['id']:
-                    next_review = datetime.fromisoformat(c['next_review']).strftime('%Y-%m-%d')
+        try:
+            # One alternate-screen session for the whole deck; the terminal's
+            # scrollback is restored untouched when it ends
+            with console.screen(hide_cursor=False):
+                for i, card in enumerate(due_cards, 1):
+                    # Separate cards with a rule instead of clearing the screen
+                    console.rule(f"[dim]Card {i}/{total_count}[/dim]", style="dim")
+
+                    # Show question
+                    console.print(Panel(
+                        f"[bold]{card['question']}[/bold]",
+                        title=f"📁 {card['category']}",
+                        border_style="cyan"
+                    ))
+
+                    console.print("\n[dim]Think about your answer...[/dim]")
+                    Prompt.ask("\nPress Enter when ready to see the answer")
+
+                    # Show answer
+                    console.print("\n" + "=" * 60)
+                    console.print(Panel(
+                        _render_markdown(card['answer']),
+                        title="Answer",
+                        border_style="green"
+                    ))
+
+                    # Get self-assessment
+                    console.print("\n[bold]How well did you know this?[/bold]")
+                    console.print("  0: Complete blackout (forgot completely)")
+                    console.print("  1: Incorrect, but remembered something")
+                    console.print("  2: Incorrect, but close")
+                    console.print("  3: [yellow]Correct, but difficult[/yellow]")
+                    console.print("  4: [green]Correct, after hesitation[/green]")
+                    console.print("  5: [bold green]Perfect recall![/bold green]")
+
+                    quality = -1
+                    while quality < 0 or quality > 5:
+                        try:
+                            quality = int(Prompt.ask("\nYour rating (0-5)", default="3"))
+                            if quality < 0 or quality > 5:
+                                console.print("[red]Please enter a number between 0 and 5[/red]")
+                        except ValueError:
+                            console.print("[red]Please enter a valid number[/red]")
+
+                    # Update card
+                    self.manager.update_card(card['id'], quality)
+
+                    if quality >= 3:
+                        correct_count += 1
+                        console.print("[green]Good job![/green]")
+                    else:
+                        console.print("[yellow]📝 We'll review this again soon.[/yellow]")
+
+                    # Show next review date
+                    updated = self.manager.get_card(card['id'])
+                    next_review = datetime.fromisoformat(updated['next_review']).strftime('%Y-%m-%d')
                     console.print(f"[dim]Next review: {next_review}[/dim]")
-                    break
 
-            if i < total_count:
-                Prompt.ask("\nPress Enter for next card")
+                    if i < total_count:
+                        Prompt.ask("\nPress Enter for next card")
+        finally:
+            # Persist reviews even if the session is interrupted (Ctrl-C)
+            self.manager.flush()
 
         # Session summary
         console.clear()
@@ -321,24 +499,29 @@ class FlashcardCLI:
 
     def show_categories(self):
         """Display all categories."""
+        from rich import box
+        from rich.prompt import Prompt
+        from rich.table import Table
+
         console.clear()
-        categories = self.manager.get_categories()
+        counts = self.manager.get_category_counts()
 
         table = Table(title="📁 Flashcard Categories", box=box.ROUNDED)
         table.add_column("Category", style="cyan")
         table.add_column("Total Cards", justify="center")
         table.add_column("Due", justify="center", style="yellow")
 
-        for category in sorted(categories):
-            cards = self.manager.get_cards(category)
-            due = len(self.manager.get_due_cards(category))
-            table.add_row(category, str(len(cards)), str(due))
+        for category in sorted(counts):
+            total, due = counts[category]
+            table.add_row(category, str(total), str(due))
 
         console.print(table)
         Prompt.ask("\nPress Enter to continue")
 
     def run(self):
         """Run the main CLI loop."""
+        from rich.prompt import Prompt
+
         while True:
             self.show_main_menu()
 
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Normalize the mock-interview question banks ahead of time.
+
+The simulator loads ``questions/*.json`` as-is, so code fields must already
+be dedented when they are stored. Run this after editing a bank (for example
+after pasting an indented solution) to dedent ``sample_solution`` and
+``test_code`` and rewrite the file in the canonical format.
+
+Usage:
+    python mock-interviews/scripts/bake_questions.py          # rewrite banks
+    python mock-interviews/scripts/bake_questions.py --check  # exit 1 if stale
+"""
+
+import argparse
+import json
+import logging
+import sys
+import textwrap
+from pathlib import Path
+from typing import Any
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+logger = logging.getLogger("bake_questions")
+
+QUESTIONS_DIR = Path(__file__).resolve().parent.parent / "questions"
+CODE_FIELDS = ("sample_solution", "test_code")
+
+
+def bake_bank(bank: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return a copy of the bank with every code field dedented."""
+    baked = []
+    for question in bank:
+        question = dict(question)
+        for field in CODE_FIELDS:
+            if isinstance(question.get(field), str):
+                question[field] = textwrap.dedent(question[field])
+        baked.append(question)
+    return baked
+
+
+def render_bank(bank: list[dict[str, Any]]) -> str:
+    """Serialize a bank in the canonical on-disk format."""
+    return json.dumps(bank, indent=2, ensure_ascii=False) + "\n"
+
+
+def main() -> int:
+    """Entry point. Returns the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report banks that need baking; do not rewrite them",
+    )
+    args = parser.parse_args()
+
+    stale = []
+    for path in sorted(QUESTIONS_DIR.glob("*.json")):
+        current = path.read_text(encoding="utf-8")
+        baked = render_bank(bake_bank(json.loads(current)))
+        if baked == current:
+            continue
+        stale.append(path.name)
+        if not args.check:
+            path.write_text(baked, encoding="utf-8")
+            logger.info("Baked %s", path.name)
+
+    if args.check and stale:
+        logger.error("Banks need baking: %s", ", ".join(stale))
+        return 1
+    if not stale:
+        logger.info("All question banks are already baked")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,21 +2,65 @@
 """Progress tracking and analytics for interview prep."""
 
 import json
+import os
 import sys
 import logging
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Dict, List
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich import box
 from rich.progress import Progress, BarColumn, TextColumn
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib json module
+    orjson = None
+
 logger = logging.getLogger(__name__)
 console = Console()
 
 
+# Every bar the tracker can draw, one per filled decile
+_BARS = tuple("=" * filled + "-" * (10 - filled) for filled in range(11))
+
+
+def _percent(completed: int, total: int) -> float:
+    """Return completed/total as a percentage, or 0 for an empty total."""
+    return (completed / total * 100) if total > 0 else 0
+
+
+def _breakdown(groups: Dict[str, Dict]) -> List[Tuple[str, int, int, float]]:
+    """Flatten a by_difficulty/by_category mapping into rendered-ready rows.
+
+    Each row is (name, completed, total, percentage), computed in one pass
+    so the render loops only format.
+    """
+    return [
+        (name, stats['completed'], stats['total'], _percent(stats['completed'], stats['total']))
+        for name, stats in groups.items()
+    ]
+
+
+def _add_rows(table: Table, rows: Iterable[Tuple[str, ...]]) -> Table:
+    """Append prebuilt rows to a Rich table and return the table."""
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
+    return table
+
+
+def _status_label(pct: float) -> str:
+    """Return the DONE/WIP/TODO markup for a completion percentage."""
+    if pct == 100:
+        return "[green]DONE[/green]"
+    return "[yellow]WIP[/yellow]" if pct >= 50 else "[red]TODO[/red]"
+
+
 class ProgressTracker:
     """Track and analyze interview prep progress."""
 
@@ -28,6 +72,9 @@ class ProgressTracker:
         """
         self.tracker_file = Path(tracker_file)
         self.data = self._load_data()
+        self._dirty = False
+        # (raw ISO string, parsed date) for the last interview_date seen
+        self._interview_date = (None, None)
 
     def _load_data(self) -> Dict:
         """Load progress data from JSON."""
@@ -35,152 +82,197 @@ class ProgressTracker:
             console.print(f"[red]Error: Tracker file not found: {self.tracker_file}[/red]")
             sys.exit(1)
 
-        with open(self.tracker_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # One read of the whole file instead of json.load's small chunked reads
+        raw = self.tracker_file.read_bytes()
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
 
     def save_data(self):
-        """Save progress data to JSON."""
-        with open(self.tracker_file, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=2)
-
-    def get_days_until_interview(self) -> int:
-        """Get number of days until interview."""
-        interview_date = datetime.fromisoformat(self.data['interview_date']).date()
-        today = datetime.now().date()
+        """Save progress data to JSON.
+
+        The data is serialized once and written to a sibling temp file,
+        which then replaces the tracker so a crash never leaves it
+        half-written.
+        """
+        if orjson is not None:
+            payload = orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self.data, indent=2).encode('utf-8')
+
+        tmp_file = self.tracker_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.tracker_file)
+        self._dirty = False
+
+    def flush(self):
+        """Write pending changes to disk, if there are any."""
+        if self._dirty:
+            self.save_data()
+
+    @contextmanager
+    def batch(self):
+        """Defer saving until the block exits, then write once.
+
+        Sessions logged inside the block with ``flush=False`` are kept in
+        memory and persisted together by a single ``save_data`` call.
+        """
+        try:
+            yield self
+        finally:
+            self.flush()
+
+    def get_days_until_interview(self, today: Optional[date] = None) -> int:
+        """Get number of days until interview.
+
+        Args:
+            today: Date to count from; defaults to the current local date
+        """
+        raw = self.data['interview_date']
+        cached_raw, interview_date = self._interview_date
+        if raw != cached_raw:
+            # Parse only when the stored date changes, not on every render
+            interview_date = datetime.fromisoformat(raw).date()
+            self._interview_date = (raw, interview_date)
+        if today is None:
+            today = date.today()
         return (interview_date - today).days
 
     def get_overall_progress(self) -> float:
         """Calculate overall progress percentage."""
-        sql_completed = self.data['sql_exercises']['completed']
-        sql_total = self.data['sql_exercises']['total']
-        python_completed = self.data['python_exercises']['completed']
-        python_total = self.data['python_exercises']['total']
-
-        total_completed = sql_completed + python_completed
-        total_exercises = sql_total + python_total
-
-        return (total_completed / total_exercises * 100) if total_exercises > 0 else 0
+        sql = self.data['sql_exercises']
+        python = self.data['python_exercises']
+        return _percent(sql['completed'] + python['completed'], sql['total'] + python['total'])
 
     def display_summary(self):
         """Display comprehensive progress summary."""
-        console.clear()
-
-        days_left = self.get_days_until_interview()
-        overall = self.get_overall_progress()
+        # Buffer the whole report and write it to the terminal in one go
+        with console:
+            console.clear()
+
+            # Derive everything the report needs once, up front; the
+            # recommendations reuse the same figures
+            days_left = self.get_days_until_interview()
+            overall = self.get_overall_progress()
+            sql = self.data['sql_exercises']
+            python = self.data['python_exercises']
+            sql_pct = _percent(sql['completed'], sql['total'])
+            python_pct = _percent(python['completed'], python['total'])
+            fc = self.data['flashcards']
+            sd = self.data.get('system_design')
+            mock_count = len(self.data['mock_interviews'])
+            minutes = self.data['time_spent_minutes']
+
+            # Header
+            title = f"[bold cyan]Interview Prep Progress Report[/bold cyan]\n"
+            if days_left > 0:
+                title += f"[dim]Interview in {days_left} days[/dim]"
+            elif days_left == 0:
+                title += f"[yellow]Interview is TODAY![/yellow]"
+            else:
+                title += f"[green]Interview was {abs(days_left)} days ago[/green]"
+
+            console.print(Panel.fit(title, border_style="cyan"))
+            console.print()
 
-        # Header
-        title = f"[bold cyan]Interview Prep Progress Report[/bold cyan]\n"
-        if days_left > 0:
-            title += f"[dim]Interview in {days_left} days[/dim]"
-        elif days_left == 0:
-            title += f"[yellow]Interview is TODAY![/yellow]"
-        else:
-            title += f"[green]Interview was {abs(days_left)} days ago[/green]"
+            # Overall Progress
+            console.print(f"[bold]Overall Progress:[/bold] {overall:.1f}%")
+            self._print_progress_bar(overall)
+            console.print()
 
-        console.print(Panel.fit(title, border_style="cyan"))
-        console.print()
+            # SQL Exercises
+            console.print("[bold cyan]SQL Exercises[/bold cyan]")
+            console.print(f"   Progress: {sql['completed']}/{sql['total']} ({sql_pct:.0f}%)")
 
-        # Overall Progress
-        console.print(f"[bold]Overall Progress:[/bold] {overall:.1f}%")
-        self._print_progress_bar(overall)
-        console.print()
+            for diff, completed, total, pct in _breakdown(sql['by_difficulty']):
+                console.print(f"   {_status_label(pct)} {diff.capitalize()}: {completed}/{total} ({pct:.0f}%)")
 
-        # SQL Exercises
-        sql = self.data['sql_exercises']
-        console.print("[bold cyan]SQL Exercises[/bold cyan]")
-        console.print(f"   Progress: {sql['completed']}/{sql['total']} "
-                     f"({sql['completed']/sql['total']*100:.0f}%)")
+            console.print()
 
-        for diff, stats in sql['by_difficulty'].items():
-            pct = (stats['completed'] / stats['total'] * 100) if stats['total'] > 0 else 0
-            status = "[green]DONE[/green]" if pct == 100 else "[yellow]WIP[/yellow]" if pct >= 50 else "[red]TODO[/red]"
-            console.print(f"   {status} {diff.capitalize()}: {stats['completed']}/{stats['total']} ({pct:.0f}%)")
+            # Python Exercises
+            console.print("[bold cyan]Python Exercises[/bold cyan]")
+            console.print(f"   Progress: {python['completed']}/{python['total']} ({python_pct:.0f}%)")
 
-        console.print()
+            for category, completed, total, pct in _breakdown(python['by_category']):
+                console.print(f"   {_status_label(pct)} {category.capitalize()}: {completed}/{total} ({pct:.0f}%)")
 
-        # Python Exercises
-        python = self.data['python_exercises']
-        console.print("[bold cyan]Python Exercises[/bold cyan]")
-        console.print(f"   Progress: {python['completed']}/{python['total']} "
-                     f"({python['completed']/python['total']*100:.0f}%)")
+            console.print()
 
-        for category, stats in python['by_category'].items():
-            pct = (stats['completed'] / stats['total'] * 100) if stats['total'] > 0 else 0
-            status = "[green]DONE[/green]" if pct == 100 else "[yellow]WIP[/yellow]" if pct >= 50 else "[red]TODO[/red]"
-            console.print(f"   {status} {category.capitalize()}: {stats['completed']}/{stats['total']} ({pct:.0f}%)")
+            # Flashcards
+            console.print("[bold cyan]Flashcards[/bold cyan]")
+            console.print(f"   Total Cards: {fc.get('total_cards', 'N/A')}")
+            console.print(f"   Total Reviews: {fc['total_reviews']}")
+            console.print(f"   Cards Mastered: {fc['cards_mastered']}")
+            console.print(f"   Avg Confidence: {fc['average_confidence']:.1f}/5")
 
-        console.print()
+            console.print()
 
-        # Flashcards
-        fc = self.data['flashcards']
-        console.print("[bold cyan]Flashcards[/bold cyan]")
-        console.print(f"   Total Cards: {fc.get('total_cards', 'N/A')}")
-        console.print(f"   Total Reviews: {fc['total_reviews']}")
-        console.print(f"   Cards Mastered: {fc['cards_mastered']}")
-        console.print(f"   Avg Confidence: {fc['average_confidence']:.1f}/5")
+            # System Design
+            if sd is not None:
+                console.print("[bold cyan]System Design[/bold cyan]")
+                console.print(f"   Reviewed: {sd['scenarios_reviewed']}/{sd['total_scenarios']}")
+                console.print()
 
-        console.print()
+            # Mock Interviews
+            console.print("[bold cyan]Mock Interviews[/bold cyan]")
+            console.print(f"   Completed: {mock_count}")
 
-        # System Design
-        if 'system_design' in self.data:
-            sd = self.data['system_design']
-            console.print("[bold cyan]System Design[/bold cyan]")
-            console.print(f"   Reviewed: {sd['scenarios_reviewed']}/{sd['total_scenarios']}")
             console.print()
 
-        # Mock Interviews
-        console.print("[bold cyan]Mock Interviews[/bold cyan]")
-        console.print(f"   Completed: {len(self.data['mock_interviews'])}")
-
-        console.print()
-
-        # Time Investment
-        console.print("[bold cyan]Time Investment[/bold cyan]")
-        hours = self.data['time_spent_minutes'] / 60
-        console.print(f"   Total: {hours:.1f} hours ({self.data['time_spent_minutes']} minutes)")
+            # Time Investment
+            console.print("[bold cyan]Time Investment[/bold cyan]")
+            console.print(f"   Total: {minutes / 60:.1f} hours ({minutes} minutes)")
 
-        console.print()
+            console.print()
 
-        # Recommendations
-        self._display_recommendations()
+            # Recommendations
+            self._display_recommendations(days_left, sql_pct, python_pct, mock_count)
 
     def _print_progress_bar(self, percentage: float):
         """Print a visual progress bar."""
-        filled = int(percentage / 10)
-        empty = 10 - filled
-        bar = "=" * filled + "-" * empty
+        bar = _BARS[min(10, max(0, int(percentage / 10)))]
         console.print(f"   [{bar}] {percentage:.1f}%")
 
-    def _display_recommendations(self):
-        """Display personalized recommendations."""
+    def _display_recommendations(self, days_left: int, sql_pct: float, python_pct: float,
+                                 mock_count: int):
+        """Display personalized recommendations.
+
+        Args:
+            days_left: Days until the interview, as shown in the header
+            sql_pct: SQL exercise completion percentage
+            python_pct: Python exercise completion percentage
+            mock_count: Number of completed mock interviews
+        """
+        data = self.data
         console.print("[bold yellow]Next Steps:[/bold yellow]")
 
         recommendations = []
 
         # Check SQL progress
-        sql = self.data['sql_exercises']
-        sql_pct = (sql['completed'] / sql['total'] * 100) if sql['total'] > 0 else 0
+        sql = data['sql_exercises']
         if sql_pct < 80:
             recommendations.append(f"Complete {sql['total'] - sql['completed']} more SQL exercises")
 
         # Check Python progress
-        python = self.data['python_exercises']
-        python_pct = (python['completed'] / python['total'] * 100) if python['total'] > 0 else 0
+        python = data['python_exercises']
         if python_pct < 80:
             recommendations.append(f"Complete {python['total'] - python['completed']} more Python exercises")
 
         # Check flashcards
-        if self.data['flashcards']['total_reviews'] < 50:
+        if data['flashcards']['total_reviews'] < 50:
             recommendations.append("Review more flashcards (target: 50+ reviews)")
 
         # Check mock interviews
-        if len(self.data['mock_interviews']) < 2:
+        if mock_count < 2:
             recommendations.append("Do at least 2 mock interviews")
 
         # Check system design
-        if 'system_design' in self.data:
-            if self.data['system_design']['scenarios_reviewed'] < 3:
-                recommendations.append("Review at least 3 system design scenarios")
+        sd = data.get('system_design')
+        if sd is not None and sd['scenarios_reviewed'] < 3:
+            recommendations.append("Review at least 3 system design scenarios")
 
         if not recommendations:
             console.print("   [green]Great progress! Keep refining your skills![/green]")
@@ -191,7 +283,6 @@ class ProgressTracker:
         console.print()
 
         # Days until interview
-        days_left = self.get_days_until_interview()
         if days_left > 0:
             console.print(f"[bold]You have {days_left} days to prepare. Stay focused![/bold]")
         elif days_left == 0:
@@ -199,79 +290,81 @@ class ProgressTracker:
 
     def display_detailed_stats(self):
         """Display detailed statistics in table format."""
-        console.clear()
-        console.print(Panel.fit(
-            "[bold cyan]Detailed Statistics[/bold cyan]",
-            border_style="cyan"
-        ))
-        console.print()
+        # Buffer the tables and write them to the terminal in one go
+        with console:
+            console.clear()
+            console.print(Panel.fit(
+                "[bold cyan]Detailed Statistics[/bold cyan]",
+                border_style="cyan"
+            ))
+            console.print()
 
-        # SQL Topics Table
-        sql_table = Table(title="SQL Topics Progress", box=box.ROUNDED)
-        sql_table.add_column("Topic", style="cyan")
-        sql_table.add_column("Completed", justify="center")
+            # SQL Topics Table
+            sql_table = Table(title="SQL Topics Progress", box=box.ROUNDED)
+            sql_table.add_column("Topic", style="cyan")
+            sql_table.add_column("Completed", justify="center")
 
-        for topic, count in self.data['sql_exercises']['by_topic'].items():
-            sql_table.add_row(topic.replace('_', ' ').title(), str(count))
+            _add_rows(sql_table, [
+                (topic.replace('_', ' ').title(), str(count))
+                for topic, count in self.data['sql_exercises']['by_topic'].items()
+            ])
 
-        console.print(sql_table)
-        console.print()
+            console.print(sql_table)
+            console.print()
 
-        # Python Categories Table
-        py_table = Table(title="Python Exercise Progress", box=box.ROUNDED)
-        py_table.add_column("Category", style="cyan")
-        py_table.add_column("Completed", justify="center")
-        py_table.add_column("Total", justify="center")
-        py_table.add_column("Percentage", justify="center")
-
-        for category, stats in self.data['python_exercises']['by_category'].items():
-            pct = (stats['completed'] / stats['total'] * 100) if stats['total'] > 0 else 0
-            py_table.add_row(
-                category.replace('_', ' ').title(),
-                str(stats['completed']),
-                str(stats['total']),
-                f"{pct:.0f}%"
-            )
-
-        console.print(py_table)
-        console.print()
+            # Python Categories Table
+            py_table = Table(title="Python Exercise Progress", box=box.ROUNDED)
+            py_table.add_column("Category", style="cyan")
+            py_table.add_column("Completed", justify="center")
+            py_table.add_column("Total", justify="center")
+            py_table.add_column("Percentage", justify="center")
 
-        # Flashcard Categories Table
-        fc_table = Table(title="Flashcard Progress by Category", box=box.ROUNDED)
-        fc_table.add_column("Category", style="cyan")
-        fc_table.add_column("Reviews", justify="center")
+            _add_rows(py_table, [
+                (category.replace('_', ' ').title(), str(completed), str(total), f"{pct:.0f}%")
+                for category, completed, total, pct
+                in _breakdown(self.data['python_exercises']['by_category'])
+            ])
 
-        for category, count in self.data['flashcards']['by_category'].items():
-            fc_table.add_row(category, str(count))
+            console.print(py_table)
+            console.print()
 
-        console.print(fc_table)
-        console.print()
+            # Flashcard Categories Table
+            fc_table = Table(title="Flashcard Progress by Category", box=box.ROUNDED)
+            fc_table.add_column("Category", style="cyan")
+            fc_table.add_column("Reviews", justify="center")
+
+            _add_rows(fc_table, [
+                (category, str(count))
+                for category, count in self.data['flashcards']['by_category'].items()
+            ])
+
+            console.print(fc_table)
+            console.print()
+
+            # Daily Logs
+            if self.data['daily_logs']:
+                log_table = Table(title="Recent Study Sessions", box=box.ROUNDED)
+                log_table.add_column("Date", style="cyan")
+                log_table.add_column("Type", justify="center")
+                log_table.add_column("Duration (min)", justify="center")
+                log_table.add_column("Details")
 
-        # Daily Logs
-        if self.data['daily_logs']:
-            log_table = Table(title="Recent Study Sessions", box=box.ROUNDED)
-            log_table.add_column("Date", style="cyan")
-            log_table.add_column("Type", justify="center")
-            log_table.add_column("Duration (min)", justify="center")
-            log_table.add_column("Details")
-
-            for log in self.data['daily_logs'][-10:]:
-                log_table.add_row(
-                    log['date'][:16],
-                    log['type'],
-                    str(log['duration_minutes']),
-                    log.get('details', '')
-                )
-
-            console.print(log_table)
-
-    def log_study_session(self, session_type: str, duration_minutes: int, details: str = ""):
+                _add_rows(log_table, [
+                    (log['date'][:16], log['type'], str(log['duration_minutes']), log.get('details', ''))
+                    for log in self.data['daily_logs'][-10:]
+                ])
+
+                console.print(log_table)
+
+    def log_study_session(self, session_type: str, duration_minutes: int, details: str = "",
+                          flush: bool = True):
         """Log a study session.
 
         Args:
             session_type: Type of session (sql, python, flashcards, mock_interview)
             duration_minutes: Duration in minutes
             details: Additional details
+            flush: Save immediately; pass False to defer to ``flush()``
         """
         log_entry = {
             "date": datetime.now().isoformat(),
@@ -282,11 +375,23 @@ class ProgressTracker:
 
         self.data['daily_logs'].append(log_entry)
         self.data['time_spent_minutes'] += duration_minutes
-        self.save_data()
+        self._dirty = True
+        if flush:
+            self.save_data()
 
         console.print(f"[green]Logged {duration_minutes} minute {session_type} session[/green]")
         logger.info("Logged %d minute %s session", duration_minutes, session_type)
 
+    def log_study_sessions(self, entries: Iterable[Tuple[str, int, str]]):
+        """Log several study sessions with a single save.
+
+        Args:
+            entries: (session_type, duration_minutes, details) tuples
+        """
+        with self.batch():
+            for session_type, duration_minutes, details in entries:
+                self.log_study_session(session_type, duration_minutes, details, flush=False)
+
 
 def main():
     """Main entry point."""
@@ -303,7 +408,8 @@ def main():
     )
     parser.add_argument(
         "--log-session",
-        help="Log a study session (format: type,duration,details)"
+        action="append",
+        help="Log a study session (format: type,duration,details); repeat to log several"
     )
 
     args = parser.parse_args()
@@ -316,15 +422,21 @@ def main():
     tracker = ProgressTracker(str(tracker_file))
 
     if args.log_session:
-        parts = args.log_session.split(',')
-        if len(parts) >= 2:
-            session_type = parts[0]
-            duration = int(parts[1])
+        entries = []
+        for spec in args.log_session:
+            parts = spec.split(',')
+            try:
+                if len(parts) < 2:
+                    raise ValueError(spec)
+                duration = int(parts[1])
+            except ValueError:
+                console.print(f"[red]Error: Invalid log entry '{spec}'. "
+                              "Use: type,duration,details (duration in whole minutes)[/red]")
+                sys.exit(1)
             details = parts[2] if len(parts) > 2 else ""
-            tracker.log_study_session(session_type, duration, details)
-        else:
-            console.print("[red]Error: Invalid log format. Use: type,duration,details[/red]")
-            sys.exit(1)
+            entries.append((parts[0], duration, details))
+        # Validate every entry first, then write the tracker once
+        tracker.log_study_sessions(entries)
     elif args.report == "summary":
         tracker.display_summary()
     elif args.report == "detailed":
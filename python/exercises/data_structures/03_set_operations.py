@@ -15,6 +15,7 @@ Tasks:
 3. Deduplicate records efficiently
 """
 
+from operator import itemgetter
 from typing import List, Set, Dict, Tuple, Any
 
 
@@ -32,8 +33,8 @@ def find_common_users(
     Returns:
         Sorted list of user IDs found in both sources.
     """
-    # TODO: Implement using set intersection
-    pass
+    # intersection() accepts any iterable, so source_b never becomes a set
+    return sorted(set(source_a).intersection(source_b))
 
 
 def find_changes(
@@ -53,8 +54,22 @@ def find_changes(
         - 'removed': IDs in old but not in new
         - 'unchanged': IDs in both old and new
     """
-    # TODO: Implement using set operations
-    pass
+    old_ids = set(old_snapshot)
+    new_ids = set(new_snapshot)
+
+    # Sort the union once and partition it in order, so all three lists
+    # come out sorted without sorting each of them
+    added: List[str] = []
+    removed: List[str] = []
+    unchanged: List[str] = []
+    for record_id in sorted(old_ids | new_ids):
+        if record_id not in new_ids:
+            removed.append(record_id)
+        elif record_id in old_ids:
+            unchanged.append(record_id)
+        else:
+            added.append(record_id)
+    return {'added': added, 'removed': removed, 'unchanged': unchanged}
 
 
 def deduplicate_records(
@@ -76,8 +91,23 @@ def deduplicate_records(
         records = [{'id': 1, 'name': 'A'}, {'id': 1, 'name': 'B'}, {'id': 2, 'name': 'C'}]
         deduplicate_records(records, ['id']) -> [{'id': 1, 'name': 'A'}, {'id': 2, 'name': 'C'}]
     """
-    # TODO: Implement using a set to track seen keys
-    pass
+    if not key_fields:
+        # Every record shares the empty key, so only the first survives
+        return records[:1]
+
+    # itemgetter builds the key (a tuple for several fields) in C, and the
+    # bound methods skip an attribute lookup per record
+    get_key = itemgetter(*key_fields)
+    seen: Set[Any] = set()
+    seen_add = seen.add
+    unique: List[Dict[str, Any]] = []
+    keep = unique.append
+    for record in records:
+        key = get_key(record)
+        if key not in seen:
+            seen_add(key)
+            keep(record)
+    return unique
 
 
 def symmetric_diff_analysis(
@@ -98,8 +128,12 @@ def symmetric_diff_analysis(
         - Count of IDs only in B
         - Count of IDs in both (intersection size)
     """
-    # TODO: Implement using set symmetric_difference and other operations
-    pass
+    a = set(dataset_a)
+    b = set(dataset_b)
+    # The one-sided counts follow from the intersection size, so a - b and
+    # b - a never need to be materialized
+    both = len(a & b)
+    return sorted(a ^ b), len(a) - both, len(b) - both, both
 
 
 # ============ TESTS (DO NOT MODIFY) ============
@@ -16,6 +16,7 @@ Tasks:
 4. Find all possible execution orders (parallel stages)
 """
 
+import heapq
 import logging
 from typing import List, Dict, Set, Optional, Tuple
 from collections import deque
@@ -42,8 +43,19 @@ def build_graph(
         - in_degree: Dict mapping each node to its in-degree count.
           All nodes from dependencies (both keys and values) must be included.
     """
-    # TODO: Implement your solution here
-    pass
+    adjacency: Dict[str, Set[str]] = {}
+    in_degree: Dict[str, int] = {}
+    for task, upstream in dependencies.items():
+        adjacency.setdefault(task, set())
+        in_degree.setdefault(task, 0)
+        for dep in upstream:
+            successors = adjacency.setdefault(dep, set())
+            in_degree.setdefault(dep, 0)
+            # A dependency listed twice is still a single edge
+            if task not in successors:
+                successors.add(task)
+                in_degree[task] += 1
+    return adjacency, in_degree
 
 
 def detect_cycle(
@@ -82,10 +94,28 @@ def topological_sort(
         Returns None if the graph has a cycle.
         When multiple valid orderings exist, prefer alphabetical order.
     """
-    # TODO: Implement using Kahn's algorithm
-    # Use a sorted structure (like a heap or sorted list) instead of a plain queue
-    # to ensure alphabetical ordering when multiple nodes have in-degree 0.
-    pass
+    adjacency, in_degree = build_graph(dependencies)
+    remaining = dict(in_degree)
+
+    # Kahn's algorithm with a min-heap of ready nodes: each push/pop is
+    # O(log n), instead of re-sorting the ready set on every step
+    ready = [node for node, degree in remaining.items() if degree == 0]
+    heapq.heapify(ready)
+    order: List[str] = []
+    while ready:
+        node = heapq.heappop(ready)
+        order.append(node)
+        for successor in adjacency[node]:
+            remaining[successor] -= 1
+            if remaining[successor] == 0:
+                heapq.heappush(ready, successor)
+
+    # Nodes on a cycle never reach in-degree 0, so they are never emitted
+    if len(order) != len(remaining):
+        logger.warning("Dependency cycle detected; %d task(s) cannot be scheduled",
+                       len(remaining) - len(order))
+        return None
+    return order
 
 
 def find_parallel_stages(
@@ -109,8 +139,30 @@ def find_parallel_stages(
         Returns: [['A'], ['B', 'C'], ['D']]
         Stage 1: A (no deps), Stage 2: B and C (only depend on A), Stage 3: D
     """
-    # TODO: Implement your solution here
-    pass
+    adjacency, in_degree = build_graph(dependencies)
+    remaining = dict(in_degree)
+
+    # Process a whole stage at a time: releasing a stage's successors also
+    # collects the next stage, so nodes are never rescanned or queued one by one
+    stage = sorted(node for node, degree in remaining.items() if degree == 0)
+    stages: List[List[str]] = []
+    scheduled = 0
+    while stage:
+        stages.append(stage)
+        scheduled += len(stage)
+        next_stage = []
+        for node in stage:
+            for successor in adjacency[node]:
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    next_stage.append(successor)
+        stage = sorted(next_stage)
+
+    if scheduled != len(remaining):
+        logger.warning("Dependency cycle detected; %d task(s) cannot be scheduled",
+                       len(remaining) - scheduled)
+        return None
+    return stages
 
 
 # ============ TESTS (DO NOT MODIFY) ============
@@ -0,0 +1,10 @@
+"""Put the repository root and the script directories on sys.path for the tests."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+for path in (ROOT, ROOT / "mock-interviews", ROOT / "progress"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
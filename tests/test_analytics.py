@@ -0,0 +1,64 @@
+"""Tests for session logging in progress/analytics.py."""
+
+import json
+import sys
+
+import pytest
+
+import analytics
+from analytics import ProgressTracker
+
+
+def _tracker_file(tmp_path):
+    tracker_file = tmp_path / "tracker.json"
+    tracker_file.write_text(json.dumps({"daily_logs": [], "time_spent_minutes": 0}), encoding="utf-8")
+    return tracker_file
+
+
+def test_batch_saves_once_on_exit(tmp_path, monkeypatch):
+    tracker = ProgressTracker(str(_tracker_file(tmp_path)))
+    saves = []
+    original_save = tracker.save_data
+    monkeypatch.setattr(tracker, "save_data", lambda: saves.append(1) or original_save())
+
+    with tracker.batch():
+        tracker.log_study_session("sql", 30, "window functions", flush=False)
+        tracker.log_study_session("python", 15, flush=False)
+        assert saves == []
+
+    assert saves == [1]
+    saved = json.loads((tmp_path / "tracker.json").read_text(encoding="utf-8"))
+    assert [log["type"] for log in saved["daily_logs"]] == ["sql", "python"]
+    assert saved["time_spent_minutes"] == 45
+
+
+def _run_main(monkeypatch, tracker_file, *specs):
+    monkeypatch.setattr(analytics, "ProgressTracker", lambda _: ProgressTracker(str(tracker_file)))
+    argv = ["analytics.py"]
+    for spec in specs:
+        argv += ["--log-session", spec]
+    monkeypatch.setattr(sys, "argv", argv)
+    analytics.main()
+
+
+def test_log_session_writes_every_entry(tmp_path, monkeypatch):
+    tracker_file = _tracker_file(tmp_path)
+    _run_main(monkeypatch, tracker_file, "sql,30,joins", "flashcards,10")
+
+    saved = json.loads(tracker_file.read_text(encoding="utf-8"))
+    assert [(log["type"], log["duration_minutes"], log["details"]) for log in saved["daily_logs"]] == [
+        ("sql", 30, "joins"),
+        ("flashcards", 10, ""),
+    ]
+
+
+@pytest.mark.parametrize("bad_spec", ["sql,abc", "sql"])
+def test_log_session_rejects_bad_entry_before_writing(tmp_path, monkeypatch, bad_spec):
+    tracker_file = _tracker_file(tmp_path)
+    original = tracker_file.read_text(encoding="utf-8")
+
+    with pytest.raises(SystemExit) as exc_info:
+        _run_main(monkeypatch, tracker_file, "python,20", bad_spec)
+
+    assert exc_info.value.code == 1
+    assert tracker_file.read_text(encoding="utf-8") == original
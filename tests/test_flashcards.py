@@ -0,0 +1,119 @@
+"""Tests for the flashcard manager in concepts/flashcards/cli.py."""
+
+import json
+from datetime import date, datetime, timedelta
+
+from concepts.flashcards.cli import FlashcardManager
+
+
+def _card(card_id, category):
+    """Build a never-reviewed card, which is always due."""
+    return {
+        "id": card_id,
+        "category": category,
+        "question": f"Question {card_id}",
+        "answer": f"Answer {card_id}",
+        "difficulty": "easy",
+        "tags": [],
+        "last_reviewed": None,
+        "next_review": None,
+        "confidence": 0,
+        "ease_factor": 2.5,
+        "interval": 0,
+        "repetitions": 0,
+    }
+
+
+def _manager(tmp_path, autosave_every=20):
+    cards_file = tmp_path / "cards.json"
+    cards = [_card(1, "SQL"), _card(2, "SQL"), _card(3, "Python")]
+    cards_file.write_text(json.dumps({"cards": cards}), encoding="utf-8")
+    return FlashcardManager(str(cards_file), autosave_every=autosave_every)
+
+
+def _due_ids(manager, category=None):
+    return [card["id"] for card in manager.get_due_cards(category)]
+
+
+def test_get_due_cards_filters_by_category(tmp_path):
+    manager = _manager(tmp_path)
+    assert _due_ids(manager) == [1, 2, 3]
+    assert _due_ids(manager, "SQL") == [1, 2]
+
+
+def test_get_due_cards_unknown_category_is_empty(tmp_path):
+    manager = _manager(tmp_path)
+    assert manager.get_due_cards("No Such Category") == []
+    assert manager.get_cards("No Such Category") == []
+
+
+def test_update_card_reschedules_due_queue(tmp_path):
+    manager = _manager(tmp_path, autosave_every=0)
+    # Fill the due cache first, so the updates below must invalidate it
+    assert _due_ids(manager) == [1, 2, 3]
+    assert _due_ids(manager, "SQL") == [1, 2]
+
+    manager.update_card(1, 5, now=datetime.now())
+    assert _due_ids(manager) == [2, 3]
+    assert _due_ids(manager, "SQL") == [2]
+
+    # A failed review long ago is due again, even after being rescheduled
+    long_ago = datetime.now() - timedelta(days=30)
+    manager.update_card(2, 1, now=long_ago)
+    assert _due_ids(manager, "SQL") == [2]
+
+    # Reviewing card 1 in the past leaves a stale future entry in the heap
+    manager.update_card(1, 5, now=long_ago)
+    assert _due_ids(manager) == [1, 2, 3]
+    assert _due_ids(manager, "SQL") == [1, 2]
+    assert _due_ids(manager, "Python") == [3]
+
+
+def test_update_card_sets_next_review_from_interval(tmp_path):
+    manager = _manager(tmp_path, autosave_every=0)
+    now = datetime(2026, 1, 1, 9, 30)
+    manager.update_card(3, 4, now=now)
+    card = manager.get_card(3)
+    assert card["interval"] == 1
+    assert card["repetitions"] == 1
+    assert card["last_reviewed"] == now.isoformat()
+    assert card["next_review"] == date(2026, 1, 2).isoformat()
+
+
+def test_autosave_every_defers_writes_until_threshold(tmp_path):
+    manager = _manager(tmp_path, autosave_every=2)
+    cards_file = tmp_path / "cards.json"
+    original = cards_file.read_text(encoding="utf-8")
+
+    manager.update_card(1, 5)
+    assert cards_file.read_text(encoding="utf-8") == original
+
+    manager.update_card(2, 5)
+    saved = json.loads(cards_file.read_text(encoding="utf-8"))
+    assert [card["repetitions"] for card in saved["cards"]] == [1, 1, 0]
+
+
+def test_flush_writes_only_pending_updates(tmp_path):
+    manager = _manager(tmp_path, autosave_every=0)
+    cards_file = tmp_path / "cards.json"
+    original = cards_file.read_text(encoding="utf-8")
+
+    manager.flush()
+    assert cards_file.read_text(encoding="utf-8") == original
+
+    manager.update_card(3, 5)
+    assert cards_file.read_text(encoding="utf-8") == original
+    manager.flush()
+    saved = json.loads(cards_file.read_text(encoding="utf-8"))
+    assert saved["cards"][2]["repetitions"] == 1
+
+
+def test_save_cards_replaces_file_with_indented_json(tmp_path):
+    manager = _manager(tmp_path)
+    manager.save_cards()
+
+    cards_file = tmp_path / "cards.json"
+    text = cards_file.read_text(encoding="utf-8")
+    assert text.startswith('{\n  "cards": [\n')
+    assert json.loads(text) == manager.data
+    assert not cards_file.with_suffix(".json.tmp").exists()
@@ -0,0 +1,64 @@
+"""Tests for the code evaluator in mock-interviews/technical_interview.py."""
+
+import technical_interview as ti
+
+
+def test_passing_run_is_cached():
+    code = "print('All tests passed')"
+    passed, output = ti.evaluate_python_code(code, "# cached")
+    assert passed
+    assert output == "All tests passed"
+    assert (passed, output) in ti._eval_cache.values()
+    assert ti.evaluate_python_code(code, "# cached") == (passed, output)
+
+
+def test_failing_run_is_not_cached():
+    cache_size = len(ti._eval_cache)
+    passed, output = ti.evaluate_python_code("assert 1 == 2", "")
+    assert not passed
+    assert "AssertionError" in output
+    assert len(ti._eval_cache) == cache_size
+
+
+def test_syntax_error_is_reported_without_running():
+    passed, output = ti.evaluate_python_code("def broken(:", "")
+    assert not passed
+    assert output.startswith('File "<solution>", line 1')
+    assert output.endswith("SyntaxError: invalid syntax")
+
+
+def test_worker_crash_is_reported_with_exit_code():
+    passed, output = ti.evaluate_python_code("import os\nos._exit(3)", "")
+    assert not passed
+    assert output == "Execution crashed: the worker process exited with code 3."
+
+    # The pool replaces the dead worker, so the next run still works
+    assert ti.evaluate_python_code("print('All tests passed')", "# after crash")[0]
+
+
+def test_runaway_code_times_out(monkeypatch):
+    monkeypatch.setattr(ti, "EVAL_TIMEOUT_SECONDS", 1)
+    passed, output = ti.evaluate_python_code("while True:\n    pass", "")
+    assert not passed
+    assert output == "Execution timed out after 1 seconds."
+
+    assert ti.evaluate_python_code("print('All tests passed')", "# after timeout")[0]
+
+
+def test_sql_keywords_credit_overlapping_phrases():
+    assert ti.evaluate_sql_keywords("SELECT COUNT(*) FROM t", ["COUNT(*)", "COUNT("]) == (1.0, [])
+    assert ti.evaluate_sql_keywords("SELECT COUNT(id) FROM t", ["COUNT(*)", "COUNT("]) == (0.5, ["COUNT(*)"])
+    assert ti.evaluate_sql_keywords(
+        "SELECT SUM(x) OVER (PARTITION BY y ORDER BY z) FROM t", ["PARTITION BY", "ORDER BY", "BY", "SUM("]
+    ) == (1.0, [])
+
+
+def test_sql_keywords_group_by_spans_whitespace():
+    sql = "SELECT dept, COUNT(*)\nFROM emp\nGROUP\n    BY dept"
+    assert ti.evaluate_sql_keywords(sql, ["GROUP BY", "GROUP"]) == (1.0, [])
+    assert ti.evaluate_sql_keywords("SELECT * FROM grouped", ["GROUP BY", "GROUP"]) == (0.0, ["GROUP BY", "GROUP"])
+
+
+def test_sql_keywords_match_whole_words():
+    assert ti.evaluate_sql_keywords("SELECT DENSE_RANK() OVER (ORDER BY x)", ["RANK"]) == (0.0, ["RANK"])
+    assert ti.evaluate_sql_keywords("select rank() over (order by x)", ["RANK", "order by"]) == (1.0, [])